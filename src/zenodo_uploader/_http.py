@@ -0,0 +1,102 @@
+# src/zenodo_uploader/_http.py
+
+# HTTP transport used by the core library functions in cli.py. It lives in its
+# own module so that `requests` and `urllib3` are only imported once a command
+# actually talks to Zenodo, keeping `--help` and `configure` fast.
+
+import logging
+import threading
+import time
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+UPLOAD_BLOCK_SIZE = 1024 * 1024  # Bytes read from disk and sent per socket write.
+# (connect, read) timeout in seconds for API calls.
+DEFAULT_TIMEOUT = (10, 300)
+# urllib3 applies the connect timeout to every socket write while a request body is sent,
+# so bucket PUTs use a long one: a 1 MiB block then only has to go out within 300s, not 10s.
+# The read timeout is generous because Zenodo only answers a file PUT after it has stored
+# and checksummed the whole body.
+UPLOAD_TIMEOUT = (300, 300)
+# Transient failures are retried with exponential backoff (0.5s, 1s, 2s, ...) so a
+# single 5xx or rate-limit response does not abort a long batch of uploads. File bodies
+# are rewound by urllib3 before each retry; 429 responses honour `Retry-After`.
+RETRY_STATUSES = [429, 502, 503, 504]
+# POSTs create drafts and publish records, so they are only retried when Zenodo has
+# certainly not acted on them; a 502/504 can arrive after the POST already took effect.
+POST_RETRY_STATUSES = frozenset({429, 503})
+RATE_LIMIT_MAX_WAIT = 60  # Longest rate-limit pause in seconds, in case the local clock lags Zenodo's.
+POOL_MAXSIZE = 32  # Keep-alive connections per host; also the largest accepted --parallel value.
+
+log = logging.getLogger(__name__)
+
+class _ZenodoRetry(Retry):
+    """Retry policy that retries GETs and PUTs on `RETRY_STATUSES` but POSTs only on `POST_RETRY_STATUSES`."""
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method == "POST":
+            return status_code in POST_RETRY_STATUSES
+        return super().is_retry(method, status_code, has_retry_after)
+
+class ZenodoAdapter(HTTPAdapter):
+    """HTTPAdapter that streams request bodies in large blocks instead of urllib3's 16 KiB default
+    and applies `DEFAULT_TIMEOUT` to requests that do not set their own.
+
+    It also honours Zenodo's rate-limit headers: once a response reports
+    `X-RateLimit-Remaining: 0`, every request through this adapter (from any thread) waits
+    for `Retry-After` or until `X-RateLimit-Reset`, at most `RATE_LIMIT_MAX_WAIT` seconds.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._rate_limit_lock = threading.Lock()
+        self._rate_limit_reset = 0.0
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("blocksize", UPLOAD_BLOCK_SIZE)
+        super().init_poolmanager(*args, **kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        with self._rate_limit_lock:
+            wait = self._rate_limit_reset - time.time()
+        if wait > 0:
+            log.info(f"   - Zenodo rate limit reached; waiting {wait:.0f}s...")
+            time.sleep(wait)
+
+        response = super().send(request, timeout=timeout if timeout is not None else DEFAULT_TIMEOUT, **kwargs)
+
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            now = time.time()
+            try:
+                # Retry-After is relative, so it does not depend on the local and server clocks agreeing.
+                wait = float(response.headers["Retry-After"])
+            except (KeyError, ValueError):
+                try:
+                    reset = float(response.headers["X-RateLimit-Reset"])
+                except (KeyError, ValueError):
+                    reset = 1.0
+                # The reset is normally an epoch timestamp; small values are seconds from now.
+                wait = reset - now if reset > 1e9 else reset
+            reset_at = now + min(max(wait, 0.0), RATE_LIMIT_MAX_WAIT)
+            with self._rate_limit_lock:
+                self._rate_limit_reset = max(self._rate_limit_reset, reset_at)
+        return response
+
+@lru_cache(maxsize=None)
+def get_session(token: str) -> requests.Session:
+    """Returns the process-wide authenticated session for `token`, creating it on first use.
+
+    Every call with the same token shares one connection pool, so keep-alive connections to
+    Zenodo survive across library calls instead of being re-established by each function.
+    """
+    session = requests.Session()
+    # Per-session headers are sent with every request; JSON bodies get their Content-Type from `json=`.
+    session.headers.update({"Authorization": f"Bearer {token}", "Accept": "application/json"})
+    retries = _ZenodoRetry(total=5, backoff_factor=0.5, status_forcelist=RETRY_STATUSES, allowed_methods={"GET", "PUT"})
+    # One pool each for zenodo.org and sandbox.zenodo.org.
+    adapter = ZenodoAdapter(pool_connections=2, pool_maxsize=POOL_MAXSIZE, max_retries=retries)
+    session.mount("https://", adapter)
+    return session
@@ -1,14 +1,26 @@
 # src/zenodo_uploader/cli.py
 
-import requests
+# Only the standard library is imported at module level; `requests`, `tqdm` and the
+# TOML libraries are imported inside the functions that need them to keep CLI startup fast.
 import argparse
+import base64
+import hashlib
 import json
+import mmap
 import os
+import shutil
+import stat
 import sys
-import toml
+import time
 import logging
-from tqdm import tqdm
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from functools import lru_cache
+from urllib.parse import quote
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Tuple
+
+if TYPE_CHECKING:
+    import requests
 
 # =============================================================================
 # 1. SETUP & CONFIGURATION
@@ -17,58 +29,371 @@ from typing import List, Optional, Dict, Any
 # --- Constants ---
 ZENODO_URLS = {"production": "https://zenodo.org/api", "sandbox": "https://sandbox.zenodo.org/api"}
 CONFIG_FILE_NAME = ".zenodo.toml"
+_UPDATABLE_FIELDS = ('title', 'description', 'author')  # Metadata the 'update' command can change.
+DEFAULT_MAX_CONCURRENCY = 4
+PROGRESS_MIN_SIZE = 1024 * 1024  # Smaller files, or uploads with stderr redirected, get no progress bar.
+MMAP_MIN_SIZE = 64 * 1024 * 1024  # Files at least this large are memory-mapped for upload.
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "zenodo-uploader")
+API_CACHE_DIR = os.path.join(CACHE_DIR, "api")  # Used only when the ZENODO_CACHE=1 environment variable is set.
+LIST_PAGE_SIZE = 100  # Depositions requested per page when listing.
+API_CACHE_TTL = 30  # Seconds a cached API response is served without contacting Zenodo.
+HASH_CACHE_FILE = os.path.join(CACHE_DIR, "hashes.json")  # MD5s of local files, keyed by path, mtime and size.
+INFLIGHT_DIR = os.path.join(CACHE_DIR, "inflight")  # Drafts created by `upload` runs that have not finished yet.
 
 # --- Logging Setup ---
 logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stderr)
 log = logging.getLogger(__name__)
 
 # --- Helper Functions ---
-def gb_to_bytes(gb: float) -> int:
-    """Converts gigabytes to bytes."""
-    return int(gb * 1024 * 1024 * 1024)
+def _load_toml(path: str) -> Dict[str, Any]:
+    """Parses a TOML file with tomllib (Python 3.11+) or its tomli backport."""
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        import tomli as tomllib
+    with open(path, "rb") as f:
+        return tomllib.load(f)
 
+@lru_cache(maxsize=1)
 def load_config() -> Dict[str, Any]:
     """Loads configuration from a .zenodo.toml file in the current or home directory."""
+    # Cached for the lifetime of the process; call `load_config.cache_clear()` after writing a new file.
     search_paths = [os.path.join(os.getcwd(), CONFIG_FILE_NAME), os.path.join(os.path.expanduser("~"), CONFIG_FILE_NAME)]
     for path in search_paths:
         if os.path.exists(path):
             log.info(f"--- Loading configuration from: {path} ---")
             try:
-                with open(path, "r", encoding="utf-8") as f:
-                    return toml.load(f)
+                return _load_toml(path)
             except Exception as e:
                 log.warning(f"Warning: Could not parse config file at {path}. Error: {e}")
     return {}
 
+@lru_cache(maxsize=2)
 def _get_api_base(sandbox: bool) -> str:
     """Gets the correct API base URL based on the sandbox flag."""
     return ZENODO_URLS["sandbox"] if sandbox else ZENODO_URLS["production"]
 
-def _upload_file_with_progress(session: requests.Session, file_path: str, bucket_url: str):
-    """Uploads a single file to a bucket URL with a progress bar."""
+class _MappedFile:
+    """Read-only, file-like view of a memory-mapped file whose reads are zero-copy memoryview slices."""
+
+    # `fileno`, `mode`, `tell` and `seek` let requests size the body and urllib3 rewind it on retries.
+    mode = "rb"
+
+    def __init__(self, fp):
+        self._fp = fp
+        self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        self._pos = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def fileno(self) -> int:
+        return self._fp.fileno()
+
+    def read(self, size: int = -1) -> memoryview:
+        end = len(self._view) if size is None or size < 0 else min(self._pos + size, len(self._view))
+        chunk = self._view[self._pos:end]
+        self._pos = end
+        return chunk
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        base = {os.SEEK_SET: 0, os.SEEK_CUR: self._pos, os.SEEK_END: len(self._view)}[whence]
+        self._pos = base + offset
+        return self._pos
+
+    def close(self):
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass  # A slice is still referenced; the mapping is released once it is collected.
+
+def _stat_files(file_paths: List[str]) -> List[Tuple[str, os.stat_result]]:
+    """Returns (path, stat) pairs for the given files. Exits if any is missing, not a regular file or unreadable."""
+    files = []
+    for file_path in file_paths:
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            log.error(f"   ✗ ERROR: File not found: '{file_path}'")
+            sys.exit(1)
+        except OSError as e:
+            log.error(f"   ✗ ERROR: Cannot access '{file_path}'. Reason: {e}")
+            sys.exit(1)
+        if not stat.S_ISREG(st.st_mode):
+            log.error(f"   ✗ ERROR: Not a regular file: '{file_path}'")
+            sys.exit(1)
+        if not os.access(file_path, os.R_OK):
+            log.error(f"   ✗ ERROR: File is not readable: '{file_path}'")
+            sys.exit(1)
+        files.append((file_path, st))
+    return files
+
+def _make_cache_dir(path: str = CACHE_DIR):
+    """Creates `path` under `CACHE_DIR`, keeping `CACHE_DIR` readable only by the current user."""
+    # The cache holds draft titles, deposition IDs and local paths; mode 0700 on CACHE_DIR
+    # (re-applied to directories created by older versions) hides everything below it.
+    os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+    os.chmod(CACHE_DIR, 0o700)
+    os.makedirs(path, mode=0o700, exist_ok=True)
+
+def _api_cache_enabled() -> bool:
+    """The on-disk API response cache is opt-in via the ZENODO_CACHE=1 environment variable."""
+    return os.environ.get("ZENODO_CACHE") == "1"
+
+def _cached_get_json(session: "requests.Session", url: str, ttl: int = API_CACHE_TTL) -> Any:
+    """GETs `url` and returns its JSON body, going through the on-disk API cache if enabled."""
+    if not _api_cache_enabled():
+        r = session.get(url)
+        r.raise_for_status()
+        return r.json()
+
+    # Entries are keyed on the token and URL, so accounts never share them. Responses younger than
+    # `ttl` seconds are served without a request; older ones are revalidated with If-None-Match.
+    key = hashlib.sha1(f"{session.headers.get('Authorization')} {url}".encode("utf-8")).hexdigest()
+    body_path = os.path.join(API_CACHE_DIR, f"{key}.json")
+    meta_path = os.path.join(API_CACHE_DIR, f"{key}.metadata")
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(body_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        meta, cached = {}, None
+
+    if cached is not None and time.time() - meta.get("timestamp", 0) < ttl:
+        log.debug(f"API cache hit: {url}")
+        return cached
+
+    headers = {"If-None-Match": meta["etag"]} if cached is not None and meta.get("etag") else {}
+    r = session.get(url, headers=headers)
+    if r.status_code == 304:
+        log.debug(f"API cache revalidated: {url}")
+        data = cached
+    else:
+        log.debug(f"API cache miss: {url}")
+        r.raise_for_status()
+        data = r.json()
+    try:
+        _make_cache_dir(API_CACHE_DIR)
+        with open(body_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump({"timestamp": time.time(), "etag": r.headers.get("ETag", meta.get("etag"))}, f)
+    except OSError as e:
+        log.debug(f"Could not write API cache entry for {url}: {e}")
+    return data
+
+def _invalidate_api_cache():
+    """Drops all cached API responses; called before any change to a deposition."""
+    if _api_cache_enabled():
+        shutil.rmtree(API_CACHE_DIR, ignore_errors=True)
+
+def _inflight_path(api_base: str, file_paths: List[str], title: Optional[str]) -> str:
+    """Path of the record tracking the draft created for this exact upload (API, files and title)."""
+    key_parts = [api_base, title or ""] + sorted(os.path.abspath(file_path) for file_path in file_paths)
+    key = hashlib.sha256("\n".join(key_parts).encode("utf-8")).hexdigest()
+    return os.path.join(INFLIGHT_DIR, f"{key}.json")
+
+def _record_inflight(inflight_path: str, dep: Dict[str, Any]):
+    """Remembers the draft created for an upload so an interrupted run can resume it."""
+    try:
+        _make_cache_dir(INFLIGHT_DIR)
+        with open(inflight_path, "w", encoding="utf-8") as f:
+            json.dump({'deposition_id': dep['id'], 'bucket_url': dep['links']['bucket'], 'draft_url': dep['links']['latest_draft_html']}, f)
+    except OSError as e:
+        log.debug(f"Could not record in-flight upload {inflight_path}: {e}")
+
+def _clear_inflight(inflight_path: str):
+    """Forgets the draft recorded at `inflight_path` once its upload has completed."""
+    try:
+        os.remove(inflight_path)
+    except OSError:
+        pass
+
+def _resume_deposition(session: "requests.Session", api_base: str, inflight_path: str) -> Optional[Dict[str, Any]]:
+    """Returns the unpublished draft recorded at `inflight_path`, or None if there is none to resume."""
+    try:
+        with open(inflight_path, "r", encoding="utf-8") as f:
+            deposition_id = json.load(f)['deposition_id']
+    except (OSError, ValueError, KeyError):
+        return None
+    r = session.get(f"{api_base}/deposit/depositions/{deposition_id}")
+    if r.status_code in (403, 404, 410):
+        return None
+    r.raise_for_status()
+    dep = r.json()
+    return None if dep['submitted'] else dep
+
+def _md5(file_path: str) -> str:
+    """Returns the hex MD5 digest of a file, the checksum Zenodo reports for stored files."""
+    # Flagged as a non-security use (Python 3.9+) so MD5 stays available on FIPS-enabled hosts.
+    new_md5 = (lambda: hashlib.md5(usedforsecurity=False)) if sys.version_info >= (3, 9) else hashlib.md5
+    with open(file_path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, new_md5).hexdigest()
+        digest = new_md5()
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+def _load_hash_cache() -> Dict[str, Any]:
+    """Reads `HASH_CACHE_FILE`, which maps absolute paths to [mtime_ns, size, hex MD5]."""
+    try:
+        with open(HASH_CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _store_digests(files: List[Tuple[str, os.stat_result]], digests: Dict[str, str]):
+    """Adds the digests known for (path, stat) pairs to `HASH_CACHE_FILE`."""
+    cache = _load_hash_cache()
+    for file_path, st in files:
+        if file_path in digests:
+            cache[os.path.abspath(file_path)] = [st.st_mtime_ns, st.st_size, digests[file_path]]
+    try:
+        _make_cache_dir()
+        with open(HASH_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        log.debug(f"Could not write hash cache {HASH_CACHE_FILE}: {e}")
+
+def _file_digests(files: List[Tuple[str, os.stat_result]], compute: bool = True) -> Dict[str, str]:
+    """Returns {path: hex MD5} for (path, stat) pairs, memoized in `HASH_CACHE_FILE`. Exits if hashing fails."""
+    # With `compute=False` only memoized digests are returned; `_upload_files` hashes the rest as it sends them.
+    cache = _load_hash_cache()
+    digests, stale = {}, []
+    for file_path, st in files:
+        entry = cache.get(os.path.abspath(file_path))
+        if entry and entry[:2] == [st.st_mtime_ns, st.st_size]:
+            digests[file_path] = entry[2]
+        else:
+            stale.append((file_path, st))
+    if not stale or not compute:
+        return digests
+
+    failed = False
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as hasher:
+        hashes = {hasher.submit(_md5, file_path): file_path for file_path, _ in stale}
+        try:
+            for done in as_completed(hashes):
+                try:
+                    digests[hashes[done]] = done.result()
+                except (OSError, ValueError) as e:  # ValueError: MD5 disabled, e.g. by FIPS mode.
+                    log.error(f"   ✗ ERROR: Could not hash '{hashes[done]}'. Reason: {e}")
+                    failed = True
+                    break
+        finally:
+            # Leaving early (an error or Ctrl-C) must not wait for files that have not started hashing.
+            for pending in hashes:
+                pending.cancel()
+    _store_digests(stale, digests)
+    if failed:
+        sys.exit(1)
+    return digests
+
+def _upload_file_with_progress(session: "requests.Session", file_path: str, file_size: int, target_url: str, md5: str) -> Dict[str, Any]:
+    """Uploads a single file of a known size to its bucket object URL. Returns Zenodo's file record."""
+    import requests
+    from ._http import UPLOAD_TIMEOUT
     filename = os.path.basename(file_path)
-    file_size = os.path.getsize(file_path)
     try:
-        with open(file_path, 'rb') as fp:
-            with tqdm.wrapattr(fp, "read", total=file_size, desc=f"   - Uploading {filename}", unit="B", unit_scale=True, unit_divisor=1024) as bar:
-                r = session.put(f"{bucket_url}/{filename}", data=bar)
-                r.raise_for_status()
+        # Small files, or uploads with stderr redirected, are streamed without tqdm's per-read wrapper.
+        show_progress = file_size >= PROGRESS_MIN_SIZE and sys.stderr.isatty()
+        headers = {"Content-MD5": base64.b64encode(bytes.fromhex(md5)).decode("ascii")}
+        with open(file_path, 'rb') as fp, (_MappedFile(fp) if file_size >= MMAP_MIN_SIZE else nullcontext(fp)) as body:
+            if show_progress:
+                from tqdm import tqdm
+                with tqdm.wrapattr(body, "read", total=file_size, desc=f"   - Uploading {filename}", unit="B", unit_scale=True, unit_divisor=1024) as bar:
+                    r = session.put(target_url, data=bar, headers=headers, timeout=UPLOAD_TIMEOUT)
+            else:
+                r = session.put(target_url, data=body, headers=headers, timeout=UPLOAD_TIMEOUT)
+        r.raise_for_status()
+        if not show_progress:
+            log.info(f"   - Uploaded {filename}")
+        return r.json()
     except (requests.exceptions.RequestException, IOError) as e:
         log.error(f"   ✗ ERROR: Failed to upload '{filename}'. Reason: {e.response.text if hasattr(e, 'response') and e.response else e}")
         sys.exit(1)
 
+def _pending_files(files: List[Tuple[str, os.stat_result]], digests: Dict[str, str], dep: Dict[str, Any]) -> List[Tuple[str, os.stat_result]]:
+    """Drops (path, stat) pairs already present in the deposition with the same name and MD5 checksum."""
+    uploaded = {f['filename']: f['checksum'].split(':')[-1] for f in dep.get('files', [])}
+    pending = []
+    for file_path, st in files:
+        if file_path in digests and uploaded.get(os.path.basename(file_path)) == digests[file_path]:
+            log.info(f"   - Skipping '{file_path}': already uploaded.")
+        else:
+            pending.append((file_path, st))
+    return pending
+
+def _upload_files(session: "requests.Session", files: List[Tuple[str, os.stat_result]], digests: Dict[str, str], bucket_url: str, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+    """Uploads (path, stat) pairs to a bucket URL, `max_concurrency` at a time. Exits on the first failure."""
+    # Files missing from `digests` are hashed by their upload worker just before they are sent, so
+    # hashing overlaps the other uploads. Every checksum Zenodo reports is compared with the local digest.
+    unhashed = [(file_path, st) for file_path, st in files if file_path not in digests]
+    digests = dict(digests)
+
+    def hash_and_upload(file_path: str, st: os.stat_result) -> Dict[str, Any]:
+        if file_path not in digests:
+            digests[file_path] = _md5(file_path)
+        return _upload_file_with_progress(session, file_path, st.st_size, f"{bucket_url}/{quote(os.path.basename(file_path), safe='')}", digests[file_path])
+
+    failed = False
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+        uploads = {executor.submit(hash_and_upload, file_path, st): file_path for file_path, st in files}
+        try:
+            for upload in as_completed(uploads):
+                file_path = uploads[upload]
+                try:
+                    checksum = upload.result().get('checksum')
+                except (OSError, ValueError) as e:  # Raised by _md5; upload errors are logged by the worker.
+                    log.error(f"   ✗ ERROR: Could not hash '{file_path}'. Reason: {e}")
+                    failed = True
+                except SystemExit:  # The worker has already logged the error.
+                    failed = True
+                else:
+                    if checksum and checksum != f"md5:{digests[file_path]}":
+                        log.error(f"   ✗ ERROR: Checksum mismatch for '{file_path}': Zenodo stored {checksum}, local file is md5:{digests[file_path]}.")
+                        failed = True
+                if failed:
+                    break
+        finally:
+            # Leaving early (a failure or Ctrl-C) must not wait for uploads that have not started.
+            for pending in uploads:
+                pending.cancel()
+    if unhashed:
+        _store_digests(unhashed, digests)
+    if failed:
+        sys.exit(1)
+
 # =============================================================================
 # 2. CORE LIBRARY FUNCTIONS
 # =============================================================================
 
 def list_depositions(token: str, sandbox: bool = False) -> List[Dict[str, Any]]:
-    """Lists all depositions for a user. Returns the raw list of deposition dictionaries."""
+    """Lists all depositions for a user, following pagination. Returns the raw list of deposition dictionaries."""
+    import requests
+    from ._http import get_session
     BASE_URL = _get_api_base(sandbox)
-    headers = {"Authorization": f"Bearer {token}"}
+    session = get_session(token)
     try:
-        r = requests.get(f"{BASE_URL}/deposit/depositions", headers=headers)
-        r.raise_for_status()
-        return r.json()
+        depositions = []
+        page = 1
+        while True:
+            batch = _cached_get_json(session, f"{BASE_URL}/deposit/depositions?page={page}&size={LIST_PAGE_SIZE}")
+            # Zenodo may cap the page size below LIST_PAGE_SIZE, so only an empty page marks the end.
+            if not batch:
+                return depositions
+            depositions.extend(batch)
+            page += 1
     except requests.exceptions.RequestException as e:
         log.error(f"✗ ERROR: Failed to list depositions. Reason: {e.response.text if e.response else e}")
         sys.exit(1)
@@ -78,13 +403,17 @@ def update_deposition(
     deposition_id: int,
     metadata: Optional[Dict[str, Any]] = None,
     files_to_add: Optional[List[str]] = None,
-    sandbox: bool = False
+    sandbox: bool = False,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
 ) -> Dict[str, Any]:
     """Updates an existing draft deposition. Returns the final deposition dictionary."""
+    import requests
+    from ._http import get_session
     BASE_URL = _get_api_base(sandbox)
-    session = requests.Session()
-    session.headers.update({"Authorization": f"Bearer {token}"})
+    session = get_session(token)
     deposition_url = f"{BASE_URL}/deposit/depositions/{deposition_id}"
+    # Check every file before touching the deposition, so a bad path fails before anything is uploaded.
+    files = _stat_files(files_to_add or [])
     
     try:
         log.info(f"   - Fetching deposition {deposition_id} details...")
@@ -97,31 +426,46 @@ def update_deposition(
             sys.exit(1)
         
         bucket_url = dep['links']['bucket']
-
-        if files_to_add:
-            log.info(f"\n   - Adding {len(files_to_add)} new file(s)...")
-            for file_path in files_to_add:
-                if not os.path.exists(file_path):
-                    log.error(f"   ✗ ERROR: File to add not found: '{file_path}'")
-                    continue
-                _upload_file_with_progress(session, file_path, bucket_url)
-            log.info("   ✓ New files added successfully.")
-        
-        if metadata:
-            log.info("\n   - Updating metadata...")
-            current_metadata = dep.get('metadata', {})
-            # Simple merge for top-level keys like 'title', 'description', etc.
-            current_metadata.update(metadata)
-            # Special handling for creators if 'author' is provided
-            if 'author' in metadata:
-                current_metadata['creators'] = [{'name': metadata['author']}]
-            
-            data = {'metadata': current_metadata}
-            r_meta = session.put(deposition_url, data=json.dumps(data), headers={"Content-Type": "application/json"})
-            r_meta.raise_for_status()
-            log.info("   ✓ Metadata updated successfully.")
-
-        # Fetch the final state
+        _invalidate_api_cache()
+
+        # The metadata PUT and the bucket uploads are independent, so they run side by side.
+        with ThreadPoolExecutor(max_workers=1) as metadata_executor:
+            if metadata:
+                log.info("\n   - Updating metadata...")
+                current_metadata = dep.get('metadata', {})
+                changes = dict(metadata)
+                # 'author' is not a Zenodo field; it maps onto the creators list.
+                if 'author' in changes:
+                    changes['creators'] = [{'name': changes.pop('author')}]
+                # Simple merge for top-level keys like 'title', 'description', etc.
+                current_metadata.update(changes)
+
+                data = {'metadata': current_metadata}
+                metadata_future = metadata_executor.submit(session.put, deposition_url, json=data)
+
+            if files_to_add:
+                log.info(f"\n   - Adding {len(files_to_add)} new file(s)...")
+                # Hash up front only if there are stored files to compare against; otherwise the upload workers hash.
+                try:
+                    digests = _file_digests(files, compute=bool(dep.get('files')))
+                    _upload_files(session, _pending_files(files, digests, dep), digests, bucket_url, max_concurrency)
+                except BaseException:
+                    # The metadata PUT is already on its way, so the draft may now have new metadata but not all files.
+                    if metadata and metadata_future.exception() is None and metadata_future.result().ok:
+                        log.error("   ✗ The metadata was updated, but not all new files were added; the draft is only partially updated.")
+                    raise
+                log.info("   ✓ New files added successfully.")
+
+            if metadata:
+                r_meta = metadata_future.result()
+                r_meta.raise_for_status()
+                log.info("   ✓ Metadata updated successfully.")
+
+        if not files_to_add:
+            # The metadata PUT answers with the full deposition; with no changes at all, the first GET is current.
+            return r_meta.json() if metadata else dep
+
+        # Files were added; fetch the deposition again so its file listing is current.
         r_final = session.get(deposition_url)
         r_final.raise_for_status()
         return r_final.json()
@@ -132,34 +476,46 @@ def update_deposition(
 
 def upload(token: str, file_paths: List[str], metadata: Dict[str, Any], **kwargs) -> Dict[str, Any]:
     """Creates a new deposition and uploads files."""
+    import requests
+    from ._http import get_session
     sandbox = kwargs.get('sandbox', False)
     publish = kwargs.get('publish', False)
+    max_concurrency = kwargs.get('max_concurrency', DEFAULT_MAX_CONCURRENCY)
 
     env = "sandbox" if sandbox else "production"
     BASE_URL = _get_api_base(sandbox)
-    session = requests.Session()
-    session.headers.update({"Authorization": f"Bearer {token}"})
+    session = get_session(token)
     
     log.info(f"--- Using {env.upper()} environment ---")
-    log.info("1. Creating new deposition record...")
+    # Check every file before creating the draft, so a bad path does not leave an empty deposition behind.
+    files = _stat_files(file_paths)
+    total_size = sum(st.st_size for _, st in files)
+
+    # Re-running an interrupted upload of the same files and title resumes its draft instead of orphaning it.
+    inflight_path = _inflight_path(BASE_URL, file_paths, metadata.get('title'))
     try:
-        r = session.post(f'{BASE_URL}/deposit/depositions', json={})
-        r.raise_for_status()
-        dep = r.json()
+        dep = _resume_deposition(session, BASE_URL, inflight_path)
+        if dep:
+            log.info(f"1. Resuming draft {dep['id']} from an interrupted upload...")
+        else:
+            log.info("1. Creating new deposition record...")
+            r = session.post(f'{BASE_URL}/deposit/depositions', json={})
+            r.raise_for_status()
+            dep = r.json()
+            _record_inflight(inflight_path, dep)
         deposition_id = dep['id']
         bucket_url = dep['links']['bucket']
         draft_url = dep['links']['latest_draft_html']
+        _invalidate_api_cache()
         log.info(f"   ✓ Success! Deposition ID: {deposition_id}")
     except requests.exceptions.RequestException as e:
         log.error(f"   ✗ ERROR: Failed to create deposition. Reason: {e.response.text if e.response else e}")
         sys.exit(1)
 
-    log.info(f"\n2. Starting upload of {len(file_paths)} files...")
-    for file_path in file_paths:
-        if not os.path.exists(file_path):
-            log.error(f"   ✗ ERROR: File not found: '{file_path}'")
-            sys.exit(1)
-        _upload_file_with_progress(session, file_path, bucket_url)
+    log.info(f"\n2. Starting upload of {len(files)} files ({total_size / (1024 * 1024):.1f} MiB)...")
+    # A draft without files has nothing to skip, so its files are hashed by the upload workers as they are sent.
+    digests = _file_digests(files, compute=bool(dep.get('files')))
+    _upload_files(session, _pending_files(files, digests, dep), digests, bucket_url, max_concurrency)
     log.info("   ✓ All files uploaded successfully!")
 
     log.info("\n3. Adding metadata...")
@@ -174,9 +530,11 @@ def upload(token: str, file_paths: List[str], metadata: Dict[str, Any], **kwargs
     if metadata.get('version'): metadata_payload['metadata']['version'] = metadata.get('version')
     if metadata.get('keywords'): metadata_payload['metadata']['keywords'] = metadata.get('keywords')
 
-    r_meta = session.put(f"{BASE_URL}/deposit/depositions/{deposition_id}", data=json.dumps(metadata_payload), headers={"Content-Type": "application/json"})
+    r_meta = session.put(f"{BASE_URL}/deposit/depositions/{deposition_id}", json=metadata_payload)
     r_meta.raise_for_status()
     log.info("   ✓ Metadata added successfully!")
+    # Files and metadata are in place, so a later run with the same arguments starts a new deposition.
+    _clear_inflight(inflight_path)
 
     final_data = r_meta.json()
     if not publish:
@@ -207,30 +565,33 @@ def handle_list(args: argparse.Namespace):
     if not depositions:
         log.info("No depositions found.")
         return
-    log.info(f"Found {len(depositions)} depositions:")
-    log.info("-" * 80)
-    log.info(f"{'ID':<12} {'Status':<12} {'DOI':<25} {'Title'}")
-    log.info("-" * 80)
+    if not log.isEnabledFor(logging.INFO):
+        return
+    # Build the whole table first and emit it as one log record instead of one per row.
+    separator = "-" * 80
+    rows = [f"Found {len(depositions)} depositions:", separator, f"{'ID':<12} {'Status':<12} {'DOI':<25} {'Title'}", separator]
     for dep in depositions:
         status = 'published' if dep['submitted'] else 'draft'
         title = dep.get('metadata', {}).get('title', 'No Title')
         doi = dep.get('doi', 'N/A')
-        log.info(f"{dep['id']:<12} {status:<12} {doi:<25} {title[:60]}")
-    log.info("-" * 80)
+        rows.append(f"{dep['id']:<12} {status:<12} {doi:<25} {title[:60]}")
+    rows.append(separator)
+    log.info("\n".join(rows))
 
 def handle_update(args: argparse.Namespace):
     """CLI handler for the 'update' subcommand."""
     log.info(f"Executing 'update' command for deposition ID: {args.deposition_id}...")
     metadata_to_update = {
-        k: v for k, v in vars(args).items() 
-        if k in ['title', 'description', 'author'] and v is not None
+        k: getattr(args, k) for k in _UPDATABLE_FIELDS
+        if getattr(args, k) is not None
     }
     final_dep = update_deposition(
         token=args.token,
         deposition_id=args.deposition_id,
         files_to_add=args.add_files,
         metadata=metadata_to_update if metadata_to_update else None,
-        sandbox=args.sandbox
+        sandbox=args.sandbox,
+        max_concurrency=args.parallel
     )
     log.info(f"\n✅ Update complete. Review your draft at: {final_dep['links']['latest_draft_html']}")
 
@@ -242,7 +603,7 @@ def handle_upload(args: argparse.Namespace):
         'affiliation': args.affiliation, 'keywords': args.keywords, 'version': args.version,
         'upload_type': args.upload_type
     }
-    options = {'publish': args.publish, 'sandbox': args.sandbox}
+    options = {'publish': args.publish, 'sandbox': args.sandbox, 'max_concurrency': args.parallel}
     upload(token=args.token, file_paths=args.file_paths, metadata=metadata, **options)
 
 def handle_configure(args: argparse.Namespace):
@@ -260,8 +621,7 @@ def handle_configure(args: argparse.Namespace):
     existing_config = {}
     if os.path.exists(config_path):
         log.warning(f"\nWarning: Configuration file already exists at {config_path}.")
-        with open(config_path, 'r') as f:
-            existing_config = toml.load(f)
+        existing_config = _load_toml(config_path)
         overwrite = input("Do you want to overwrite it? (y/n): ").lower()
         if overwrite != 'y':
             log.info("Configuration cancelled.")
@@ -292,9 +652,11 @@ def handle_configure(args: argparse.Namespace):
         'tokens': {'production': prod_token, 'sandbox': sandbox_token}
     }
     
+    import tomli_w
     try:
-        with open(config_path, 'w', encoding='utf-8') as f:
-            toml.dump(new_config, f)
+        with open(config_path, 'wb') as f:
+            tomli_w.dump(new_config, f)
+        load_config.cache_clear()
         log.info(f"\n✓ Configuration successfully saved to {config_path}")
     except Exception as e:
         log.error(f"\n✗ ERROR: Failed to write configuration file. Reason: {e}")
@@ -303,12 +665,20 @@ def handle_configure(args: argparse.Namespace):
 # =============================================================================
 # 4. MAIN CLI ENTRY POINT
 # =============================================================================
-def main():
-    """Main function to parse arguments, select token, and route to subcommands."""
-    config = load_config()
-    default_config = config.get("default", {})
-    tokens_config = config.get("tokens", {})
-
+def _parallel_count(value: str) -> int:
+    """argparse type for --parallel: a file count between 1 and the HTTP session's connection pool size."""
+    from ._http import POOL_MAXSIZE
+    try:
+        count = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: '{value}'")
+    if not 1 <= count <= POOL_MAXSIZE:
+        raise argparse.ArgumentTypeError(f"must be between 1 and {POOL_MAXSIZE}, got {count}")
+    return count
+
+@lru_cache(maxsize=1)
+def _build_parser(default_author: Optional[str], default_affiliation: Optional[str]) -> argparse.ArgumentParser:
+    """Builds the CLI argument parser. Cached per config defaults, so repeated `main()` calls reuse it."""
     parser = argparse.ArgumentParser(description="A tool to upload, update, and manage records on Zenodo.", formatter_class=argparse.RawTextHelpFormatter)
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose (DEBUG) logging.")
     
@@ -325,13 +695,14 @@ def main():
     parser_upload = subparsers.add_parser("upload", help="Create a new record and upload files.", parents=[common_parser])
     parser_upload.add_argument("--file-paths", required=True, nargs='+', help="One or more paths to the files to upload.")
     parser_upload.add_argument("--title", required=True, help="Title of the upload.")
-    parser_upload.add_argument("--author", default=default_config.get("author"), required=not default_config.get("author"), help="Primary author name.")
+    parser_upload.add_argument("--author", default=default_author, required=not default_author, help="Primary author name.")
     parser_upload.add_argument("--description", required=True, help="A description of the upload content.")
-    parser_upload.add_argument("--affiliation", default=default_config.get("affiliation"), help="Author's affiliation.")
+    parser_upload.add_argument("--affiliation", default=default_affiliation, help="Author's affiliation.")
     parser_upload.add_argument("--keywords", nargs='*', help="Keywords for the data.")
     parser_upload.add_argument("--version", help="Version number.")
     parser_upload.add_argument("--upload-type", default='dataset', help="The type of content.")
     parser_upload.add_argument("--publish", action='store_true', default=False, help="Publish the record immediately.")
+    parser_upload.add_argument("--parallel", type=_parallel_count, default=DEFAULT_MAX_CONCURRENCY, metavar="N", help=f"Number of files to upload concurrently (default: {DEFAULT_MAX_CONCURRENCY}).")
     parser_upload.set_defaults(func=handle_upload)
 
     parser_update = subparsers.add_parser("update", help="Update an existing draft deposition.", parents=[common_parser])
@@ -340,10 +711,20 @@ def main():
     parser_update.add_argument("--title", help="Update the title.")
     parser_update.add_argument("--description", help="Update the description.")
     parser_update.add_argument("--author", help="Update the author.")
+    parser_update.add_argument("--parallel", type=_parallel_count, default=DEFAULT_MAX_CONCURRENCY, metavar="N", help=f"Number of files to upload concurrently (default: {DEFAULT_MAX_CONCURRENCY}).")
     parser_update.set_defaults(func=handle_update)
     
     parser_list = subparsers.add_parser("list", help="List your existing depositions.", parents=[common_parser])
     parser_list.set_defaults(func=handle_list)
+    return parser
+
+def main():
+    """Main function to parse arguments, select token, and route to subcommands."""
+    config = load_config()
+    default_config = config.get("default", {})
+    tokens_config = config.get("tokens", {})
+
+    parser = _build_parser(default_config.get("author"), default_config.get("affiliation"))
 
     args = parser.parse_args()
     